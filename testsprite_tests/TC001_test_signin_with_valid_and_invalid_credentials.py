@@ -1,36 +1,33 @@
+import json
+
+import orjson
+import pytest
 import requests
-import os
 
-BASE_URL = os.getenv("TEST_BASE_URL", "http://localhost:8081")
-TIMEOUT = 30
-HEADERS = {"Content-Type": "application/json"}
+from _http import HEADERS, TEST_EMAIL, TEST_PASSWORD, TIMEOUT
 
+# Invalid credentials examples
+INVALID_EMAIL = "invaliduser@example.com"
+INVALID_PASSWORD = "wrongpassword"
 
-def test_signin_with_valid_and_invalid_credentials():
-    signin_url = f"{BASE_URL}/auth/signin"
+# Payloads are static, so encode them once at import instead of
+# re-serializing on every call via json=
+INVALID_EMAIL_BODY = json.dumps({"email": INVALID_EMAIL, "password": TEST_PASSWORD})
+INVALID_PASSWORD_BODY = json.dumps({"email": TEST_EMAIL, "password": INVALID_PASSWORD})
 
-    # Valid credentials from environment variables - secure approach
-    valid_email = os.getenv("TEST_VALID_EMAIL", "test@example.com")
-    valid_password = os.getenv("TEST_VALID_PASSWORD", "password123")
 
-    # Invalid credentials examples
-    invalid_email = "invaliduser@example.com"
-    invalid_password = "wrongpassword"
+@pytest.mark.xdist_group(name="mutating")
+def test_signin_with_valid_and_invalid_credentials(http, base_url, signin_response):
+    signin_url = f"{base_url}/auth/signin"
 
-    # Test with valid credentials
-    valid_payload = {
-        "email": valid_email,
-        "password": valid_password
-    }
-    try:
-        res_valid = requests.post(signin_url, json=valid_payload, headers=HEADERS, timeout=TIMEOUT)
-    except requests.RequestException as e:
-        assert False, f"Request with valid credentials failed: {e}"
+    # Valid credentials: the session-scoped signin fixture already posted
+    # them once, so assert against its response instead of signing in again
+    res_valid = signin_response
 
     # On success, expect 200 OK and JSON with user and token
     assert res_valid.status_code == 200, f"Expected 200 for valid credentials but got {res_valid.status_code}"
     try:
-        json_data = res_valid.json()
+        json_data = orjson.loads(res_valid.content)
     except ValueError:
         assert False, "Response for valid credentials is not valid JSON"
 
@@ -40,12 +37,8 @@ def test_signin_with_valid_and_invalid_credentials():
     assert isinstance(json_data["token"], str) and len(json_data["token"]) > 0, "Invalid 'token' value"
 
     # Test with invalid credentials - invalid email, valid password
-    invalid_email_payload = {
-        "email": invalid_email,
-        "password": valid_password
-    }
     try:
-        res_invalid_email = requests.post(signin_url, json=invalid_email_payload, headers=HEADERS, timeout=TIMEOUT)
+        res_invalid_email = http.post(signin_url, data=INVALID_EMAIL_BODY, headers=HEADERS, timeout=TIMEOUT)
     except requests.RequestException as e:
         assert False, f"Request with invalid email failed: {e}"
 
@@ -53,12 +46,8 @@ def test_signin_with_valid_and_invalid_credentials():
     assert res_invalid_email.status_code != 200, "Signin succeeded with invalid email, expected failure"
 
     # Test with invalid credentials - valid email, invalid password
-    invalid_password_payload = {
-        "email": valid_email,
-        "password": invalid_password
-    }
     try:
-        res_invalid_password = requests.post(signin_url, json=invalid_password_payload, headers=HEADERS, timeout=TIMEOUT)
+        res_invalid_password = http.post(signin_url, data=INVALID_PASSWORD_BODY, headers=HEADERS, timeout=TIMEOUT)
     except requests.RequestException as e:
         assert False, f"Request with invalid password failed: {e}"
 
@@ -67,7 +56,7 @@ def test_signin_with_valid_and_invalid_credentials():
     # Optionally check error response structure or messages if present
     for res in [res_invalid_email, res_invalid_password]:
         try:
-            json_error = res.json()
+            json_error = orjson.loads(res.content)
             assert isinstance(json_error, dict), "Error response is not a JSON object"
             # May have error message or code - we don't have schema but check for typical fields
             has_error_msg = any(key in json_error for key in ["error", "message", "detail"])
@@ -76,5 +65,6 @@ def test_signin_with_valid_and_invalid_credentials():
             # Some servers may return empty body on error
             pass
 
-
-test_signin_with_valid_and_invalid_credentials()
+if __name__ == "__main__":
+    # Standalone runs go through pytest so the fixtures still apply
+    raise SystemExit(pytest.main([__file__]))
@@ -1,40 +1,37 @@
+import json
+import orjson
+import pytest
 import requests
-import uuid
-import os
-
-BASE_URL = os.getenv("TEST_BASE_URL", "http://localhost:8081")
-TIMEOUT = 30
-HEADERS = {"Content-Type": "application/json"}
-
-
-def test_signup_with_valid_and_invalid_data():
-    signup_url = f"{BASE_URL}/auth/signup"
-
-    # Valid data for successful signup - using environment variables for password
-    test_password = os.getenv("TEST_VALID_PASSWORD", "ValidPass123")
-    valid_user = {
-        "name": "Test User",
-        "email": f"testuser_{uuid.uuid4()}@example.com",
-        "password": test_password
-    }
-
-    # Invalid test cases: missing fields or invalid data
-    invalid_users = [
-        {},  # completely empty
-        {"name": "NoEmailUser", "password": test_password},  # missing email
-        {"email": "no_name@example.com", "password": test_password},  # missing name
-        {"name": "NoPasswordUser", "email": "nopassword@example.com"},  # missing password
-        {"name": "ShortPass", "email": "shortpass@example.com", "password": "short"},  # password too short
-        {"name": "InvalidEmail", "email": "invalidemail", "password": test_password},  # invalid email format
-    ]
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from _http import HEADERS, TEST_PASSWORD, TIMEOUT
+
+# Invalid test cases: missing fields or invalid data. The payloads are
+# static, so encode them once at import instead of re-serializing per call.
+INVALID_USERS = [
+    {},  # completely empty
+    {"name": "NoEmailUser", "password": TEST_PASSWORD},  # missing email
+    {"email": "no_name@example.com", "password": TEST_PASSWORD},  # missing name
+    {"name": "NoPasswordUser", "email": "nopassword@example.com"},  # missing password
+    {"name": "ShortPass", "email": "shortpass@example.com", "password": "short"},  # password too short
+    {"name": "InvalidEmail", "email": "invalidemail", "password": TEST_PASSWORD},  # invalid email format
+]
+INVALID_USER_BODIES = [(user, json.dumps(user)) for user in INVALID_USERS]
+
+
+@pytest.mark.xdist_group(name="mutating")
+def test_signup_with_valid_and_invalid_data(http, base_url, auth_responses):
+    signup_url = f"{base_url}/auth/signup"
 
     user_id = None
 
     try:
-        # Test valid signup
-        response = requests.post(signup_url, json=valid_user, headers=HEADERS, timeout=TIMEOUT)
+        # Test valid signup - the shared auth fixture already posted it,
+        # pipelined with the signin on a single connection
+        valid_user = auth_responses["signup_user"]
+        response = auth_responses["signup"]
         assert response.status_code == 201 or response.status_code == 200, f"Expected 200 or 201, got {response.status_code}"
-        resp_json = response.json()
+        resp_json = orjson.loads(response.content)
         # Validate presence of user info, at least id, name, email
         assert isinstance(resp_json, dict), "Response is not a JSON object"
         assert "id" in resp_json or "user" in resp_json, "Response missing 'id' or 'user'"
@@ -46,15 +43,22 @@ def test_signup_with_valid_and_invalid_data():
         assert resp_json.get("name", resp_json.get("user", {}).get("name")) == valid_user["name"]
         assert resp_json.get("email", resp_json.get("user", {}).get("email")) == valid_user["email"]
 
-        # Test invalid signups
-        for invalid_user in invalid_users:
-            resp = requests.post(signup_url, json=invalid_user, headers=HEADERS, timeout=TIMEOUT)
-            # We expect 4xx client error status codes for invalid data
-            assert 400 <= resp.status_code < 500, f"Expected 4xx status code for invalid data, got {resp.status_code}"
+        # Test invalid signups - the payloads are independent, so fire them
+        # concurrently and assert once all responses are in
+        with ThreadPoolExecutor(max_workers=len(INVALID_USER_BODIES)) as executor:
+            futures = {
+                executor.submit(http.post, signup_url, data=body, headers=HEADERS, timeout=TIMEOUT): invalid_user
+                for invalid_user, body in INVALID_USER_BODIES
+            }
+            for future in as_completed(futures):
+                resp = future.result()
+                # We expect 4xx client error status codes for invalid data
+                assert 400 <= resp.status_code < 500, f"Expected 4xx status code for invalid data {futures[future]}, got {resp.status_code}"
     finally:
         # If the API has a delete user endpoint, we would call it here to clean up the created user
         # However, it is not specified in the PRD so this cleanup step is omitted
         pass
 
-
-test_signup_with_valid_and_invalid_data()
\ No newline at end of file
+if __name__ == "__main__":
+    # Standalone runs go through pytest so the fixtures still apply
+    raise SystemExit(pytest.main([__file__]))
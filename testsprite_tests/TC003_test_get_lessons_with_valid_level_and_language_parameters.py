@@ -1,11 +1,12 @@
+import orjson
+import pytest
 import requests
+from concurrent.futures import ThreadPoolExecutor
 
-import os
+from _http import TIMEOUT
 
-BASE_URL = os.getenv("TEST_BASE_URL", "http://localhost:8081")
-TIMEOUT = 30
-
-def test_get_lessons_with_valid_level_and_language_parameters():
+@pytest.mark.xdist_group(name="readonly")
+def test_get_lessons_with_valid_level_and_language_parameters(http, base_url, lessons_catalog):
     headers = {
         "Accept": "application/json"
     }
@@ -13,21 +14,34 @@ def test_get_lessons_with_valid_level_and_language_parameters():
     # Valid parameters
     valid_level = "B1"
     valid_language = "English"
-    params_valid = {
-        "level": valid_level,
-        "language": valid_language
+
+    # The six GETs are independent read-only requests, so dispatch them
+    # concurrently and run the assertions once all responses are in
+    param_cases = {
+        "valid": {"level": valid_level, "language": valid_language},
+        "level_only": {"level": valid_level},
+        "language_only": {"language": valid_language},
+        "invalid_level": {"level": "Z9", "language": valid_language},
+        "invalid_language": {"level": valid_level, "language": "1234$%"},
     }
 
-    try:
-        # Test with valid level and language parameters
-        response = requests.get(
-            f"{BASE_URL}/lessons",
+    def fetch_lessons(params):
+        return http.get(
+            f"{base_url}/lessons",
             headers=headers,
-            params=params_valid,
+            params=params,
             timeout=TIMEOUT
         )
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(param_cases)) as executor:
+            futures = {name: executor.submit(fetch_lessons, params) for name, params in param_cases.items()}
+            responses = {name: future.result() for name, future in futures.items()}
+
+        # Test with valid level and language parameters
+        response = responses["valid"]
         assert response.status_code == 200, f"Expected status 200, got {response.status_code}"
-        lessons = response.json()
+        lessons = orjson.loads(response.content)
         assert isinstance(lessons, list), "Expected response to be a list"
         # Validate that each lesson matches the filter criteria
         for lesson in lessons:
@@ -40,75 +54,45 @@ def test_get_lessons_with_valid_level_and_language_parameters():
         # It's possible language check not directly in lesson, no explicit language field in schema, skip that validation here
 
         # Test with valid level only
-        params_level_only = {"level": valid_level}
-        response_level_only = requests.get(
-            f"{BASE_URL}/lessons",
-            headers=headers,
-            params=params_level_only,
-            timeout=TIMEOUT
-        )
+        response_level_only = responses["level_only"]
         assert response_level_only.status_code == 200
-        lessons_level_only = response_level_only.json()
+        lessons_level_only = orjson.loads(response_level_only.content)
         assert isinstance(lessons_level_only, list)
 
         # Test with valid language only
-        params_language_only = {"language": valid_language}
-        response_language_only = requests.get(
-            f"{BASE_URL}/lessons",
-            headers=headers,
-            params=params_language_only,
-            timeout=TIMEOUT
-        )
+        response_language_only = responses["language_only"]
         assert response_language_only.status_code == 200
-        lessons_language_only = response_language_only.json()
+        lessons_language_only = orjson.loads(response_language_only.content)
         assert isinstance(lessons_language_only, list)
 
-        # Test with missing parameters (empty)
-        response_no_params = requests.get(
-            f"{BASE_URL}/lessons",
-            headers=headers,
-            timeout=TIMEOUT
-        )
-        assert response_no_params.status_code == 200
-        lessons_no_params = response_no_params.json()
-        assert isinstance(lessons_no_params, list)
+        # Test with missing parameters (empty) - the session-scoped
+        # lessons_catalog fixture already fetched the unfiltered list
+        assert isinstance(lessons_catalog, list)
 
         # Test with invalid level parameter
-        params_invalid_level = {"level": "Z9", "language": valid_language}
-        response_invalid_level = requests.get(
-            f"{BASE_URL}/lessons",
-            headers=headers,
-            params=params_invalid_level,
-            timeout=TIMEOUT
-        )
+        response_invalid_level = responses["invalid_level"]
         # Depending on API design, could either return 400 or 200 with empty list
         assert response_invalid_level.status_code in (200, 400)
         if response_invalid_level.status_code == 200:
-            lessons_invalid_level = response_invalid_level.json()
+            lessons_invalid_level = orjson.loads(response_invalid_level.content)
             assert isinstance(lessons_invalid_level, list)
         else:
             # If error response, check error message json
             try:
-                error_json = response_invalid_level.json()
+                error_json = orjson.loads(response_invalid_level.content)
             except Exception:
                 error_json = None
             assert error_json is not None, "Error response missing JSON body"
 
         # Test with invalid language parameter (e.g. numeric)
-        params_invalid_language = {"level": valid_level, "language": "1234$%"}
-        response_invalid_language = requests.get(
-            f"{BASE_URL}/lessons",
-            headers=headers,
-            params=params_invalid_language,
-            timeout=TIMEOUT
-        )
+        response_invalid_language = responses["invalid_language"]
         assert response_invalid_language.status_code in (200, 400)
         if response_invalid_language.status_code == 200:
-            lessons_invalid_language = response_invalid_language.json()
+            lessons_invalid_language = orjson.loads(response_invalid_language.content)
             assert isinstance(lessons_invalid_language, list)
         else:
             try:
-                error_json_lang = response_invalid_language.json()
+                error_json_lang = orjson.loads(response_invalid_language.content)
             except Exception:
                 error_json_lang = None
             assert error_json_lang is not None, "Error response missing JSON body"
@@ -116,4 +100,6 @@ def test_get_lessons_with_valid_level_and_language_parameters():
     except requests.exceptions.RequestException as e:
         assert False, f"Request failed: {e}"
 
-test_get_lessons_with_valid_level_and_language_parameters()
+if __name__ == "__main__":
+    # Standalone runs go through pytest so the fixtures still apply
+    raise SystemExit(pytest.main([__file__]))
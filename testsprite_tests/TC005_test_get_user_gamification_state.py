@@ -1,39 +1,28 @@
-import requests
+import fastjsonschema
+import httpx
+import orjson
+import pytest
 
-import os
+import _schemas
 
-BASE_URL = os.getenv("TEST_BASE_URL", "http://localhost:8081")
-TIMEOUT = 30  # seconds
-
-def test_get_user_gamification_state():
-    url = f"{BASE_URL}/gamification/state"
-    headers = {
-        "Accept": "application/json"
-    }
+@pytest.mark.xdist_group(name="readonly")
+def test_get_user_gamification_state(readonly_snapshot):
+    # The session-scoped snapshot fixture already fetched this endpoint
+    # alongside the other read-only GETs over one client
+    response = readonly_snapshot["/gamification/state"]
     try:
-        response = requests.get(url, headers=headers, timeout=TIMEOUT)
         response.raise_for_status()
-    except requests.RequestException as e:
-        assert False, f"Request to {url} failed: {e}"
-
-    json_data = response.json()
+    except httpx.HTTPError as e:
+        assert False, f"Request to /gamification/state failed: {e}"
 
-    assert isinstance(json_data, dict), "Response is not a JSON object"
-    # Validate presence and type of each required field according to schema
-    expected_fields = {
-        "xp": int,
-        "level": int,
-        "streak": int,
-        "hearts": int,
-        "gems": int,
-        "achievements": list
-    }
-    for field, expected_type in expected_fields.items():
-        assert field in json_data, f"Missing field '{field}' in response"
-        assert isinstance(json_data[field], expected_type), f"Field '{field}' is not of type {expected_type.__name__}"
+    json_data = orjson.loads(response.content)
 
-    # Validate achievements array items are strings
-    for achievement in json_data["achievements"]:
-        assert isinstance(achievement, str), "Achievement item is not a string"
+    # Validate field presence and types with the compiled schema
+    try:
+        _schemas.GAMIFICATION_STATE(json_data)
+    except fastjsonschema.JsonSchemaException as e:
+        assert False, f"Gamification state does not match schema: {e}"
 
-test_get_user_gamification_state()
+if __name__ == "__main__":
+    # Standalone runs go through pytest so the fixtures still apply
+    raise SystemExit(pytest.main([__file__]))
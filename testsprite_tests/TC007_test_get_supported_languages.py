@@ -1,43 +1,44 @@
-import requests
+from operator import itemgetter
 
-import os
+import fastjsonschema
+import httpx
+import orjson
+import pytest
 
-BASE_URL = os.getenv("TEST_BASE_URL", "http://localhost:8081")
-TIMEOUT = 30
+import _schemas
 
-def test_get_supported_languages():
-    url = f"{BASE_URL}/languages"
-    headers = {
-        "Accept": "application/json"
-    }
+# Hoisted out of the test body: the expected set never changes and the
+# itemgetter avoids a per-element Python-level dict subscript
+EXPECTED_LANGUAGE_CODES = frozenset(("en", "es", "fr", "it", "hr", "zh"))
+_GET_CODE = itemgetter("code")
+
+@pytest.mark.xdist_group(name="readonly")
+def test_get_supported_languages(readonly_snapshot):
+    # The session-scoped snapshot fixture already fetched this endpoint
+    # alongside the other read-only GETs over one client
+    response = readonly_snapshot["/languages"]
     try:
-        response = requests.get(url, headers=headers, timeout=TIMEOUT)
         response.raise_for_status()
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         assert False, f"GET /languages request failed: {e}"
 
     try:
-        languages = response.json()
+        languages = orjson.loads(response.content)
     except ValueError:
         assert False, "Response is not valid JSON"
 
-    assert isinstance(languages, list), "Response should be a list"
-
-    required_keys = {"code", "name", "nativeName", "flag"}
-    for lang in languages:
-        assert isinstance(lang, dict), "Each language entry should be a dict"
-        lang_keys = set(lang.keys())
-        assert required_keys.issubset(lang_keys), \
-            f"Language object missing required keys: {required_keys - lang_keys}"
-        assert isinstance(lang["code"], str) and lang["code"], "Language code must be a non-empty string"
-        assert isinstance(lang["name"], str) and lang["name"], "Language name must be a non-empty string"
-        assert isinstance(lang["nativeName"], str) and lang["nativeName"], "nativeName must be a non-empty string"
-        assert isinstance(lang["flag"], str) and lang["flag"], "Flag must be a non-empty string"
+    # Each entry must carry non-empty code/name/nativeName/flag strings -
+    # enforced by the compiled schema
+    try:
+        _schemas.LANGUAGES(languages)
+    except fastjsonschema.JsonSchemaException as e:
+        assert False, f"Languages list does not match schema: {e}"
 
     # Validate the known supported languages are included and non-empty
-    expected_language_codes = {"en", "es", "fr", "it", "hr", "zh"}
-    found_codes = {lang["code"] for lang in languages}
-    missing_codes = expected_language_codes - found_codes
+    found_codes = set(map(_GET_CODE, languages))
+    missing_codes = EXPECTED_LANGUAGE_CODES - found_codes
     assert not missing_codes, f"Missing expected language codes: {missing_codes}"
 
-test_get_supported_languages()
\ No newline at end of file
+if __name__ == "__main__":
+    # Standalone runs go through pytest so the fixtures still apply
+    raise SystemExit(pytest.main([__file__]))
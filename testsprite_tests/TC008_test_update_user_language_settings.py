@@ -1,46 +1,59 @@
+import json
+import orjson
+import pytest
 import requests
-
-import os
-
-BASE_URL = os.getenv("TEST_BASE_URL", "http://localhost:8081")
-TIMEOUT = 30
-
-def test_update_user_language_settings():
-    url = f"{BASE_URL}/user/language-settings"
-    headers = {
-        "Content-Type": "application/json"
-    }
-
-    # Valid update payload
-    valid_payload = {
-        "mainLanguage": "en",
-        "targetLanguage": "fr",
-        "showTranslations": True,
-        "showPhonetics": False
-    }
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from _http import HEADERS, TIMEOUT
+
+# Valid update payload
+VALID_PAYLOAD = {
+    "mainLanguage": "en",
+    "targetLanguage": "fr",
+    "showTranslations": True,
+    "showPhonetics": False
+}
+
+# Invalid payloads to test error handling. All payloads are static, so
+# encode them once at import instead of re-serializing per call.
+INVALID_PAYLOADS = [
+    {},  # empty
+    {"mainLanguage": 123, "targetLanguage": "fr", "showTranslations": True, "showPhonetics": False},  # mainLanguage wrong type
+    {"mainLanguage": "en", "targetLanguage": None, "showTranslations": True, "showPhonetics": False},  # targetLanguage null
+    {"mainLanguage": "en", "targetLanguage": "fr", "showTranslations": "yes", "showPhonetics": False},  # showTranslations wrong type
+    {"mainLanguage": "en", "targetLanguage": "fr", "showTranslations": True},  # missing showPhonetics
+]
+
+VALID_BODY = json.dumps(VALID_PAYLOAD)
+INVALID_BODIES = [json.dumps(payload) for payload in INVALID_PAYLOADS]
+
+@pytest.mark.xdist_group(name="mutating")
+def test_update_user_language_settings(http, base_url, auth_token):
+    url = f"{base_url}/user/language-settings"
 
     try:
         # Test valid update
-        response = requests.put(url, json=valid_payload, headers=headers, timeout=TIMEOUT)
+        response = http.put(url, data=VALID_BODY, headers=HEADERS, timeout=TIMEOUT)
         assert response.status_code == 200, f"Expected status 200, got {response.status_code}"
-        resp_json = response.json()
-        for key, value in valid_payload.items():
+        resp_json = orjson.loads(response.content)
+        for key, value in VALID_PAYLOAD.items():
             assert key in resp_json, f"Response missing '{key}'"
             assert resp_json[key] == value, f"Expected {key}={value}, got {resp_json[key]}"
 
-        # Invalid payloads to test error handling
-        invalid_payloads = [
-            {},  # empty
-            {"mainLanguage": 123, "targetLanguage": "fr", "showTranslations": True, "showPhonetics": False},  # mainLanguage wrong type
-            {"mainLanguage": "en", "targetLanguage": None, "showTranslations": True, "showPhonetics": False},  # targetLanguage null
-            {"mainLanguage": "en", "targetLanguage": "fr", "showTranslations": "yes", "showPhonetics": False},  # showTranslations wrong type
-            {"mainLanguage": "en", "targetLanguage": "fr", "showTranslations": True},  # missing showPhonetics
-        ]
-
-        for idx, inval_payload in enumerate(invalid_payloads, start=1):
-            r = requests.put(url, json=inval_payload, headers=headers, timeout=TIMEOUT)
-            assert r.status_code >= 400 and r.status_code < 500, f"Invalid payload {idx} expected 4xx error, got {r.status_code}"
+        # The invalid payloads are rejected independently, so send them
+        # concurrently and assert once all responses are in
+        with ThreadPoolExecutor(max_workers=len(INVALID_BODIES)) as executor:
+            futures = {
+                executor.submit(http.put, url, data=body, headers=HEADERS, timeout=TIMEOUT): idx
+                for idx, body in enumerate(INVALID_BODIES, start=1)
+            }
+            for future in as_completed(futures):
+                r = future.result()
+                idx = futures[future]
+                assert r.status_code >= 400 and r.status_code < 500, f"Invalid payload {idx} expected 4xx error, got {r.status_code}"
     except requests.RequestException as e:
         assert False, f"Request failed: {e}"
 
-test_update_user_language_settings()
\ No newline at end of file
+if __name__ == "__main__":
+    # Standalone runs go through pytest so the fixtures still apply
+    raise SystemExit(pytest.main([__file__]))
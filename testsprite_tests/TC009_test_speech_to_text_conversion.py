@@ -1,14 +1,14 @@
+import orjson
+import pytest
 import requests
 from requests.exceptions import RequestException, Timeout
 
-import os
+from _http import TIMEOUT
 
-BASE_URL = os.getenv("TEST_BASE_URL", "http://localhost:8081")
-TIMEOUT = 30  # seconds
 
-
-def test_speech_to_text_conversion():
-    url = f"{BASE_URL}/speech/recognize"
+@pytest.mark.xdist_group(name="mutating")
+def test_speech_to_text_conversion(http, base_url):
+    url = f"{base_url}/speech/recognize"
     headers = {}
     # Prepare a small valid WAV audio data (1-second silent audio)
     valid_audio_content = (
@@ -20,9 +20,9 @@ def test_speech_to_text_conversion():
 
     # Test 1: Valid audio file upload
     try:
-        response = requests.post(url, files=files_valid, headers=headers, timeout=TIMEOUT)
+        response = http.post(url, files=files_valid, headers=headers, timeout=TIMEOUT)
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-        json_data = response.json()
+        json_data = orjson.loads(response.content)
         assert "text" in json_data, "Response JSON missing 'text' field"
         assert isinstance(json_data["text"], str), "'text' field is not a string"
         assert "confidence" in json_data, "Response JSON missing 'confidence' field"
@@ -35,11 +35,11 @@ def test_speech_to_text_conversion():
     # Test 2: Invalid audio file upload (e.g., wrong file type or corrupted data)
     files_invalid = {'audio': ('test.txt', b'This is not audio data', 'text/plain')}
     try:
-        response = requests.post(url, files=files_invalid, headers=headers, timeout=TIMEOUT)
+        response = http.post(url, files=files_invalid, headers=headers, timeout=TIMEOUT)
         # Either service returns 4xx or 422 or 200 with error fields, handle accordingly
         assert response.status_code != 500, "Server error on invalid audio input"
         if response.status_code == 200:
-            json_data = response.json()
+            json_data = orjson.loads(response.content)
             # Assuming invalid audio would not return text and confidence properly
             text = json_data.get("text", None)
             confidence = json_data.get("confidence", None)
@@ -53,12 +53,13 @@ def test_speech_to_text_conversion():
     # Test 3: Missing audio file (empty multipart/form-data request)
     try:
         # Send no files part
-        response = requests.post(url, files={}, headers=headers, timeout=TIMEOUT)
+        response = http.post(url, files={}, headers=headers, timeout=TIMEOUT)
         # Expecting 4xx error due to missing required audio file
         assert response.status_code != 500, "Server error on missing audio input"
         assert 400 <= response.status_code < 500, "Expected client error status for missing audio"
     except (RequestException, Timeout, AssertionError) as e:
         raise AssertionError(f"Missing audio handling failed: {e}")
 
-
-test_speech_to_text_conversion()
\ No newline at end of file
+if __name__ == "__main__":
+    # Standalone runs go through pytest so the fixtures still apply
+    raise SystemExit(pytest.main([__file__]))
@@ -1,87 +1,77 @@
+import json
+import orjson
+import pytest
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import os
+from _http import HEADERS, TIMEOUT
 
-BASE_URL = os.getenv("TEST_BASE_URL", "http://localhost:8081")
-TIMEOUT = 30
-HEADERS = {"Content-Type": "application/json"}
+# Valid test case: Provide all required fields with valid values. The
+# payloads are static, so encode them once at import instead of
+# re-serializing per call.
+VALID_BODY = json.dumps({
+    "text": "Hello, world!",
+    "language": "en",
+    "voice": "default"
+})
 
-
-def test_text_to_speech_synthesis():
-    synthesize_url = f"{BASE_URL}/speech/synthesize"
-
-    # Valid test case: Provide all required fields with valid values
-    valid_payload = {
-        "text": "Hello, world!",
+# Error cases: missing or invalid parameters, all expected to be rejected
+# with a client error
+ERROR_BODIES = {
+    "missing 'text'": json.dumps({
         "language": "en",
         "voice": "default"
-    }
-    try:
-        response = requests.post(synthesize_url, json=valid_payload, headers=HEADERS, timeout=TIMEOUT)
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-        json_resp = response.json()
-        assert "audioUrl" in json_resp, "Response JSON missing 'audioUrl'"
-        assert isinstance(json_resp["audioUrl"], str) and json_resp["audioUrl"].startswith("http"), \
-            "'audioUrl' should be a valid URL string"
-    except Exception as e:
-        assert False, f"Exception during valid synthesis request: {e}"
-
-    # Test missing 'text' parameter
-    missing_text_payload = {
-        "language": "en",
-        "voice": "default"
-    }
-    try:
-        response = requests.post(synthesize_url, json=missing_text_payload, headers=HEADERS, timeout=TIMEOUT)
-        assert response.status_code >= 400, "Expected client error status for missing 'text'"
-    except Exception as e:
-        assert False, f"Exception during missing 'text' request: {e}"
-
-    # Test missing 'language' parameter
-    missing_language_payload = {
+    }),
+    "missing 'language'": json.dumps({
         "text": "Hello again",
         "voice": "default"
-    }
-    try:
-        response = requests.post(synthesize_url, json=missing_language_payload, headers=HEADERS, timeout=TIMEOUT)
-        assert response.status_code >= 400, "Expected client error status for missing 'language'"
-    except Exception as e:
-        assert False, f"Exception during missing 'language' request: {e}"
-
-    # Test missing 'voice' parameter
-    missing_voice_payload = {
+    }),
+    "missing 'voice'": json.dumps({
         "text": "Hello once more",
         "language": "en"
-    }
-    try:
-        response = requests.post(synthesize_url, json=missing_voice_payload, headers=HEADERS, timeout=TIMEOUT)
-        assert response.status_code >= 400, "Expected client error status for missing 'voice'"
-    except Exception as e:
-        assert False, f"Exception during missing 'voice' request: {e}"
-
-    # Test invalid language code
-    invalid_language_payload = {
+    }),
+    "invalid 'language'": json.dumps({
         "text": "Bonjour",
         "language": "xx-invalid",
         "voice": "default"
-    }
-    try:
-        response = requests.post(synthesize_url, json=invalid_language_payload, headers=HEADERS, timeout=TIMEOUT)
-        assert response.status_code >= 400, "Expected client error status for invalid 'language' value"
-    except Exception as e:
-        assert False, f"Exception during invalid 'language' request: {e}"
-
-    # Test invalid voice value
-    invalid_voice_payload = {
+    }),
+    "invalid 'voice'": json.dumps({
         "text": "Hola",
         "language": "es",
         "voice": "unknown-voice"
-    }
+    }),
+}
+
+
+@pytest.mark.xdist_group(name="mutating")
+def test_text_to_speech_synthesis(http, base_url):
+    synthesize_url = f"{base_url}/speech/synthesize"
+
     try:
-        response = requests.post(synthesize_url, json=invalid_voice_payload, headers=HEADERS, timeout=TIMEOUT)
-        assert response.status_code >= 400, "Expected client error status for invalid 'voice' value"
+        response = http.post(synthesize_url, data=VALID_BODY, headers=HEADERS, timeout=TIMEOUT)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        json_resp = orjson.loads(response.content)
+        assert "audioUrl" in json_resp, "Response JSON missing 'audioUrl'"
+        assert isinstance(json_resp["audioUrl"], str) and json_resp["audioUrl"].startswith("http"), \
+            "'audioUrl' should be a valid URL string"
     except Exception as e:
-        assert False, f"Exception during invalid 'voice' request: {e}"
+        assert False, f"Exception during valid synthesis request: {e}"
 
+    # The error-case requests are independent, so send them concurrently
+    # and assert once all responses are in
+    try:
+        with ThreadPoolExecutor(max_workers=len(ERROR_BODIES)) as executor:
+            futures = {
+                executor.submit(http.post, synthesize_url, data=body, headers=HEADERS, timeout=TIMEOUT): label
+                for label, body in ERROR_BODIES.items()
+            }
+            for future in as_completed(futures):
+                response = future.result()
+                label = futures[future]
+                assert response.status_code >= 400, f"Expected client error status for {label}"
+    except Exception as e:
+        assert False, f"Exception during error-case synthesis requests: {e}"
 
-test_text_to_speech_synthesis()
\ No newline at end of file
+if __name__ == "__main__":
+    # Standalone runs go through pytest so the fixtures still apply
+    raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,50 @@
+"""Shared HTTP session for the TCxxx backend API tests.
+
+Every test file used to call `requests.post/get/put` directly, paying a
+fresh TCP+TLS handshake per request. Importing SESSION from here instead
+lets the whole suite reuse one keep-alive connection pool.
+"""
+
+import itertools
+import os
+import secrets
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+BASE_URL = os.getenv("TEST_BASE_URL", "http://localhost:8081")
+TEST_EMAIL = os.getenv("TEST_VALID_EMAIL", "test@example.com")
+TEST_PASSWORD = os.getenv("TEST_VALID_PASSWORD", "password123")
+# (connect, read): surface dead connections in seconds instead of letting a
+# single hung request stall a worker for the full read window
+TIMEOUT = (3.05, 10)
+HEADERS = {"Content-Type": "application/json"}
+
+# One CSPRNG draw per worker; unique emails are then composed from the
+# worker id, the salt and a counter instead of a urandom read per uuid4()
+_WORKER = os.getenv("PYTEST_XDIST_WORKER", "w0")
+_SALT = secrets.token_hex(4)
+_COUNTER = itertools.count()
+
+
+def unique_email():
+    """Return a signup email unique across workers and calls."""
+    return f"testuser_{_WORKER}_{_SALT}_{next(_COUNTER)}@example.com"
+
+
+SESSION = requests.Session()
+SESSION.headers.update({"Accept": "application/json"})
+
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST", "PUT"]),
+    ),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
@@ -0,0 +1,142 @@
+"""Canned local backend for running the TC suite without the real server.
+
+Enabled with TEST_MOCK=1: conftest points base_url at a pytest-httpserver
+instance registered with the handlers below, so every request is answered
+in-process on the loopback instead of depending on the app backend. The
+responses mirror the shapes asserted by TC001-TC010.
+"""
+
+import json
+import re
+
+from werkzeug.wrappers import Response
+
+TEST_LESSONS = [
+    {"lessonId": "lesson-b1-001", "title": "Greetings", "level": "B1"},
+    {"lessonId": "lesson-a1-001", "title": "Basics", "level": "A1"},
+]
+
+TEST_LANGUAGES = [
+    {"code": "en", "name": "English", "nativeName": "English", "flag": "🇬🇧"},
+    {"code": "es", "name": "Spanish", "nativeName": "Español", "flag": "🇪🇸"},
+    {"code": "fr", "name": "French", "nativeName": "Français", "flag": "🇫🇷"},
+    {"code": "it", "name": "Italian", "nativeName": "Italiano", "flag": "🇮🇹"},
+    {"code": "hr", "name": "Croatian", "nativeName": "Hrvatski", "flag": "🇭🇷"},
+    {"code": "zh", "name": "Chinese", "nativeName": "中文", "flag": "🇨🇳"},
+]
+
+TEST_ACHIEVEMENTS = [
+    {
+        "id": "first-lesson",
+        "name": "First Lesson",
+        "description": "Complete your first lesson",
+        "icon": "star",
+        "unlocked": False,
+    },
+]
+
+LANGUAGE_CODES = {language["code"] for language in TEST_LANGUAGES}
+
+
+def _json_response(data, status=200):
+    return Response(json.dumps(data), status=status, content_type="application/json")
+
+
+def _load_json(request):
+    try:
+        return json.loads(request.get_data(as_text=True) or "null")
+    except ValueError:
+        return None
+
+
+def register_mock_routes(server, email, password):
+    """Register handlers for every endpoint the TC files exercise."""
+
+    def signin(request):
+        body = _load_json(request)
+        if isinstance(body, dict) and body.get("email") == email and body.get("password") == password:
+            user = {"id": "user-1", "name": "Test User", "email": email}
+            return _json_response({"user": user, "token": "mock-token"})
+        return _json_response({"error": "Invalid credentials"}, status=401)
+
+    def signup(request):
+        body = _load_json(request)
+        if not isinstance(body, dict):
+            return _json_response({"error": "Invalid payload"}, status=400)
+        name = body.get("name")
+        user_email = body.get("email")
+        user_password = body.get("password")
+        if (
+            not isinstance(name, str) or not name
+            or not isinstance(user_email, str) or "@" not in user_email
+            or not isinstance(user_password, str) or len(user_password) < 8
+        ):
+            return _json_response({"error": "Invalid signup data"}, status=400)
+        return _json_response({"id": "user-2", "name": name, "email": user_email}, status=201)
+
+    def lessons(request):
+        level = request.args.get("level")
+        result = TEST_LESSONS
+        if level:
+            result = [lesson for lesson in TEST_LESSONS if lesson["level"] == level]
+        return _json_response(result)
+
+    def start_lesson(request):
+        lesson_id = request.path.split("/")[2]
+        if any(lesson["lessonId"] == lesson_id for lesson in TEST_LESSONS):
+            return _json_response({"lessonId": lesson_id, "status": "started"})
+        return _json_response({"error": "Lesson not found"}, status=404)
+
+    def language_settings(request):
+        body = _load_json(request)
+        if (
+            isinstance(body, dict)
+            and isinstance(body.get("mainLanguage"), str)
+            and isinstance(body.get("targetLanguage"), str)
+            and isinstance(body.get("showTranslations"), bool)
+            and isinstance(body.get("showPhonetics"), bool)
+        ):
+            return _json_response(body)
+        return _json_response({"error": "Invalid settings"}, status=400)
+
+    def recognize(request):
+        audio = request.files.get("audio")
+        if audio is None:
+            return _json_response({"error": "Missing audio"}, status=400)
+        if not (audio.content_type or "").startswith("audio/"):
+            return _json_response({"text": "", "confidence": 0})
+        return _json_response({"text": "hello", "confidence": 0.92})
+
+    def synthesize(request):
+        body = _load_json(request)
+        if (
+            isinstance(body, dict)
+            and isinstance(body.get("text"), str)
+            and body.get("language") in LANGUAGE_CODES
+            and body.get("voice") == "default"
+        ):
+            return _json_response({"audioUrl": "http://localhost/audio/mock.mp3"})
+        return _json_response({"error": "Invalid synthesis request"}, status=400)
+
+    server.expect_request("/auth/signin", method="POST").respond_with_handler(signin)
+    server.expect_request("/auth/signup", method="POST").respond_with_handler(signup)
+    server.expect_request("/lessons", method="GET").respond_with_handler(lessons)
+    server.expect_request(
+        re.compile(r"^/lessons/[^/]*/start$"), method="POST"
+    ).respond_with_handler(start_lesson)
+    server.expect_request("/gamification/state", method="GET").respond_with_handler(
+        lambda request: _json_response(
+            {"xp": 0, "level": 1, "streak": 0, "hearts": 5, "gems": 0, "achievements": []}
+        )
+    )
+    server.expect_request("/gamification/achievements", method="GET").respond_with_handler(
+        lambda request: _json_response(TEST_ACHIEVEMENTS)
+    )
+    server.expect_request("/languages", method="GET").respond_with_handler(
+        lambda request: _json_response(TEST_LANGUAGES)
+    )
+    server.expect_request("/user/language-settings", method="PUT").respond_with_handler(
+        language_settings
+    )
+    server.expect_request("/speech/recognize", method="POST").respond_with_handler(recognize)
+    server.expect_request("/speech/synthesize", method="POST").respond_with_handler(synthesize)
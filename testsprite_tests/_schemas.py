@@ -0,0 +1,53 @@
+"""Compiled JSON-schema validators for the read-only endpoint responses.
+
+The per-field isinstance/membership asserts in TC005-TC007 are expressed
+here as schemas compiled once at import; each test makes a single
+validator call instead of looping over fields in Python.
+"""
+
+import fastjsonschema
+
+GAMIFICATION_STATE = fastjsonschema.compile({
+    "type": "object",
+    "required": ["xp", "level", "streak", "hearts", "gems", "achievements"],
+    "properties": {
+        "xp": {"type": "integer"},
+        "level": {"type": "integer"},
+        "streak": {"type": "integer"},
+        "hearts": {"type": "integer"},
+        "gems": {"type": "integer"},
+        "achievements": {
+            "type": "array",
+            "items": {"type": "string"},
+        },
+    },
+})
+
+ACHIEVEMENTS = fastjsonschema.compile({
+    "type": "array",
+    "items": {
+        "type": "object",
+        "required": ["id", "name", "description", "icon", "unlocked"],
+        "properties": {
+            "id": {"type": "string"},
+            "name": {"type": "string"},
+            "description": {"type": "string"},
+            "icon": {"type": "string"},
+            "unlocked": {"type": "boolean"},
+        },
+    },
+})
+
+LANGUAGES = fastjsonschema.compile({
+    "type": "array",
+    "items": {
+        "type": "object",
+        "required": ["code", "name", "nativeName", "flag"],
+        "properties": {
+            "code": {"type": "string", "minLength": 1},
+            "name": {"type": "string", "minLength": 1},
+            "nativeName": {"type": "string", "minLength": 1},
+            "flag": {"type": "string", "minLength": 1},
+        },
+    },
+})
@@ -0,0 +1,142 @@
+import asyncio
+import os
+
+import httpx
+import orjson
+import pytest
+
+from _http import BASE_URL, SESSION, TEST_EMAIL, TEST_PASSWORD, TIMEOUT, unique_email
+
+# httpx takes a Timeout object rather than the requests-style tuple
+HTTPX_TIMEOUT = httpx.Timeout(10, connect=3.05)
+
+# TEST_MOCK=1 answers every request from an in-process canned backend so
+# the suite can run in CI sandboxes without the app server
+MOCK_MODE = os.getenv("TEST_MOCK") == "1"
+
+
+def pytest_sessionstart(session):
+    """Pre-warm the connection pool before the first test runs.
+
+    A throwaway HEAD establishes the TCP (and, for https deployments,
+    TLS) connection up front so the first real request rides a warm
+    keep-alive socket instead of paying the full handshake.
+    """
+    if MOCK_MODE:
+        return
+    try:
+        SESSION.head(BASE_URL, timeout=5)
+    except Exception:
+        # Offline or unreachable backends surface in the tests themselves
+        pass
+
+
+@pytest.fixture(scope="session")
+def http():
+    """Yield the shared pooled Session so every test on a worker reuses
+    one warm connection pool, closed once when the worker finishes."""
+    yield SESSION
+    SESSION.close()
+
+
+@pytest.fixture(scope="session")
+def mock_server():
+    """Spin up the canned local backend for TEST_MOCK runs."""
+    # Imported lazily so the dependency is only needed in mock mode
+    from pytest_httpserver import HTTPServer
+
+    from _mock_backend import register_mock_routes
+
+    server = HTTPServer()
+    server.start()
+    register_mock_routes(server, TEST_EMAIL, TEST_PASSWORD)
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def base_url(request):
+    """Resolve the backend base URL once per worker."""
+    if MOCK_MODE:
+        server = request.getfixturevalue("mock_server")
+        return server.url_for("").rstrip("/")
+    return BASE_URL
+
+
+@pytest.fixture(scope="session")
+def auth_responses(base_url):
+    """Run the valid signup and signin back to back on one connection.
+
+    Both requests target /auth/* on the same host, so they are issued
+    over a single HTTP/2-capable httpx client and multiplexed instead of
+    paying one handshake each. TC002 asserts against the signup response
+    and TC001/auth_token against the signin response.
+    """
+    signup_user = {
+        "name": "Test User",
+        "email": unique_email(),
+        "password": TEST_PASSWORD,
+    }
+    with httpx.Client(base_url=base_url, http2=True, timeout=HTTPX_TIMEOUT) as client:
+        signup = client.post("/auth/signup", json=signup_user)
+        signin = client.post(
+            "/auth/signin",
+            json={"email": TEST_EMAIL, "password": TEST_PASSWORD},
+        )
+    return {"signup_user": signup_user, "signup": signup, "signin": signin}
+
+
+@pytest.fixture(scope="session")
+def signin_response(auth_responses):
+    """The valid signin response shared by TC001 and auth_token."""
+    return auth_responses["signin"]
+
+
+@pytest.fixture(scope="session")
+def auth_token(http, signin_response):
+    """Inject the signed-in token into the shared session headers."""
+    signin_response.raise_for_status()
+    token = orjson.loads(signin_response.content)["token"]
+    http.headers["Authorization"] = f"Bearer {token}"
+    return token
+
+
+@pytest.fixture(scope="session")
+def lessons_catalog(http, base_url):
+    """Fetch the unfiltered /lessons list once per worker.
+
+    TC003 validates its no-params case against this and TC004 reads the
+    first lessonId from it, instead of each issuing the same GET again.
+    """
+    response = http.get(f"{base_url}/lessons", timeout=TIMEOUT)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+@pytest.fixture(scope="session")
+def readonly_snapshot(base_url, auth_token):
+    """Fetch the read-only endpoints concurrently over one httpx client.
+
+    TC005, TC006 and TC007 only inspect GET responses that do not depend
+    on test-local state, so the three requests are batched through a
+    single AsyncClient and the responses handed out as a snapshot.
+    """
+    paths = (
+        "/gamification/state",
+        "/gamification/achievements",
+        "/languages",
+    )
+
+    async def fetch_all():
+        async with httpx.AsyncClient(
+            base_url=base_url,
+            headers={
+                "Accept": "application/json",
+                "Authorization": f"Bearer {auth_token}",
+            },
+            timeout=HTTPX_TIMEOUT,
+        ) as client:
+            responses = await asyncio.gather(*(client.get(path) for path in paths))
+        return dict(zip(paths, responses))
+
+    return asyncio.run(fetch_all())